@@ -39,6 +39,7 @@ A Python application for tracking, reporting on timing and complexity in tests a
 import datetime
 import logging
 import tempfile
+from functools import lru_cache
 
 import colorlog
 
@@ -60,11 +61,13 @@ logger.addHandler(_filehandler)
 MAX_MESSAGE_WIDTH = 50
 
 
+@lru_cache(maxsize=4096)
 def format_date(timestamp: float) -> str:
     """Reusable timestamp -> date."""
     return datetime.date.fromtimestamp(timestamp).isoformat()
 
 
+@lru_cache(maxsize=4096)
 def format_datetime(timestamp: float) -> str:
     """Reusable timestamp -> datetime."""
     return datetime.datetime.fromtimestamp(timestamp).isoformat()
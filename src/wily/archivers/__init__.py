@@ -5,6 +5,7 @@ Specifies a standard interface for finding revisions (versions) of a path and sw
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
 from wily.config.types import WilyConfig
@@ -112,6 +113,7 @@ _ARCHIVERS: List[Archiver] = [ARCHIVER_GIT, ARCHIVER_FILESYSTEM]
 ALL_ARCHIVERS = {a.name: a for a in _ARCHIVERS}
 
 
+@lru_cache(maxsize=None)
 def resolve_archiver(name: str) -> Archiver:
     """
     Get the :class:`wily.archivers.Archiver` for a given name.
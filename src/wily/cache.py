@@ -10,7 +10,7 @@ import json
 import os.path
 import pathlib
 import shutil
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from wily import __version__, logger
 from wily.archivers import ALL_ARCHIVERS, Archiver, Revision
@@ -129,7 +129,8 @@ def store(
     if filename.exists():
         raise RuntimeError(f"File {filename} already exists, index may be corrupt.")
     with open(filename, "w") as out:
-        out.write(json.dumps(stats, indent=2))
+        # Compact output lets json use its C encoder, revision data can be large
+        out.write(json.dumps(stats, separators=(",", ":")))
     return filename
 
 
@@ -157,6 +158,12 @@ def store_archiver_index(
     with open(filename, "w") as out:
         out.write(json.dumps(index, indent=2))
     logger.debug("Created index output")
+
+    # Keep the newest record in a sidecar so it can be read without the full index
+    if index:
+        with open(root / "latest.json", "w") as out:
+            out.write(json.dumps(index[0], indent=2))
+        logger.debug("Created latest revision output")
     return filename
 
 
@@ -187,13 +194,13 @@ def get_default_metrics(config: WilyConfig) -> List[str]:
     default_metrics = []
 
     for archiver in archivers:
-        index = get_archiver_index(config, archiver)
+        latest = get_latest_revision(config, archiver)
 
-        if len(index) == 0:
+        if latest is None:
             logger.warning(_("No records found in the index, no metrics available"))
             return []
 
-        operators = index[0]["operators"]
+        operators = latest["operators"]
         for operator in operators:
             o = resolve_operator(operator)
             if o.operator_cls.default_metric_index is not None:
@@ -229,6 +236,27 @@ def get_archiver_index(config: WilyConfig, archiver: Union[Archiver, str]) -> An
     return index
 
 
+def get_latest_revision(
+    config: WilyConfig, archiver: Union[Archiver, str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the index record of the most recent revision for an archiver.
+
+    Reads the small latest.json sidecar written with the index, falling back
+    to the full index for caches built before the sidecar existed.
+
+    :param config: The configuration
+    :param archiver: The name of the archiver type (e.g. 'git')
+    :return: The index record, or None if the index is empty
+    """
+    latest = pathlib.Path(config.cache_path) / str(archiver) / "latest.json"
+    if latest.exists():
+        with latest.open("r") as latest_f:
+            return json.load(latest_f)
+    index = get_archiver_index(config, archiver)
+    return index[0] if index else None
+
+
 def get(
     config: WilyConfig, archiver: Union[Archiver, str], revision: str
 ) -> Dict[Any, Any]:
@@ -8,7 +8,7 @@ import multiprocessing
 import os
 import pathlib
 from sys import exit
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 from progress.bar import Bar
 
@@ -20,6 +20,19 @@ from wily.operators import Operator, resolve_operator
 from wily.state import State
 
 
+def native_paths(paths: Iterable[str]) -> Iterable[str]:
+    """
+    Convert forward-slash separated archiver paths to the platform's separator.
+
+    On platforms that already use forward slashes, the paths are returned as-is.
+
+    :param paths: The paths reported by the archiver
+    """
+    if os.sep == "/":
+        return paths
+    return (path.replace("/", os.sep) for path in paths)
+
+
 def run_operator(
     operator: Operator, revision: Revision, config: WilyConfig, targets: List[str]
 ) -> Tuple[str, Dict[str, Any]]:
@@ -140,8 +153,8 @@ def build(config: WilyConfig, archiver: Archiver, operators: List[Operator]) ->
                     # Copy the ir from any unchanged files from the prev revision
                     if not seed:
                         # File names in result are platform dependent, so we convert
-                        # to Path and back to str.
-                        files = {str(pathlib.Path(f)) for f in revision.tracked_files}
+                        # them to the native path separator.
+                        files = set(native_paths(revision.tracked_files))
                         missing_indices = files - indices
                         # TODO: Check existence of file path.
                         for missing in missing_indices:
@@ -166,8 +179,8 @@ def build(config: WilyConfig, archiver: Archiver, operators: List[Operator]) ->
                     # Add empty path for storing total aggregates
                     dirs = [""]
                     # Directory names in result are platform dependent, so we convert
-                    # to Path and back to str.
-                    dirs += [str(pathlib.Path(d)) for d in revision.tracked_dirs if d]
+                    # them to the native path separator.
+                    dirs += [d for d in native_paths(revision.tracked_dirs) if d]
                     # Aggregate metrics across all root paths using the aggregate function in the metric
                     # Note assumption is that nested dirs are listed after parent, hence sorting.
                     for root in sorted(dirs):
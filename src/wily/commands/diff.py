@@ -4,25 +4,23 @@ Diff command.
 Compares metrics between uncommitted files and indexed files.
 """
 import multiprocessing
-import os
 from pathlib import Path
 from sys import exit
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import radon.cli.harvest
-import tabulate
 
 from wily import format_date, format_revision, logger
 from wily.archivers import resolve_archiver
 from wily.commands.build import run_operator
 from wily.config import DEFAULT_PATH
 from wily.config.types import WilyConfig
-from wily.helper import get_maxcolwidth, get_style
+from wily.helper import iter_relative_paths, print_table
 from wily.operators import (
     BAD_COLORS,
     GOOD_COLORS,
     OperatorLevel,
-    get_metric,
+    get_path_metrics,
     resolve_metric,
     resolve_operator,
 )
@@ -60,10 +58,9 @@ def diff(
         targets = files
 
     # Expand directories to paths
-    files = [
-        os.path.relpath(fn, config.path)
-        for fn in radon.cli.harvest.iter_filenames(targets)
-    ]
+    files = list(
+        iter_relative_paths(radon.cli.harvest.iter_filenames(targets), config.path)
+    )
     logger.debug("Targeting - %s", files)
 
     if not revision:
@@ -128,15 +125,22 @@ def diff(
     for file in files:
         metrics_data = []
         has_changes = False
+        # Fetch the metrics of the file once per operator, not once per metric
+        current_metrics: Dict[str, Dict] = {}
+        new_metrics: Dict[str, Dict] = {}
         for operator, metric in resolved_metrics:
             try:
-                current = target_revision.get(
-                    config, state.default_archiver, operator, file, metric.name
-                )
+                if operator not in current_metrics:
+                    current_metrics[operator] = target_revision.get_path_metrics(
+                        config, state.default_archiver, operator, file
+                    )
+                current = current_metrics[operator][metric.name]
             except KeyError:
                 current = "-"
             try:
-                new = get_metric(data, operator, file, metric.name)
+                if operator not in new_metrics:
+                    new_metrics[operator] = get_path_metrics(data, operator, file)
+                new = new_metrics[operator][metric.name]
             except KeyError:
                 new = "-"
             if new != current:
@@ -165,15 +169,4 @@ def diff(
     descriptions = [metric.description for _, metric in resolved_metrics]
     headers = ("File", *descriptions)
     if len(results) > 0:
-        maxcolwidth = get_maxcolwidth(headers, wrap)
-        style = get_style()
-        print(
-            # But it still makes more sense to show the newest at the top, so reverse again
-            tabulate.tabulate(
-                headers=headers,
-                tabular_data=results,
-                tablefmt=style,
-                maxcolwidths=maxcolwidth,
-                maxheadercolwidths=maxcolwidth,
-            )
-        )
+        print_table(headers, results, wrap)
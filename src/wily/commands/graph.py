@@ -67,10 +67,11 @@ def graph(
     metrics_list = metrics.split(",")
 
     y_metric = resolve_metric(metrics_list[0])
+    revisions = state.index[state.default_archiver].revisions
 
     if not aggregate:
         tracked_files = set()
-        for rev in state.index[state.default_archiver].revisions:
+        for rev in revisions:
             tracked_files.update(rev.revision.tracked_files)
         paths = (
             tuple(
@@ -94,6 +95,16 @@ def graph(
     else:
         z_axis = resolve_metric(metrics_list[1])
         z_operator, z_key = metric_parts(metrics_list[1])
+
+    # Resolve the revision keys, dates and labels once, rather than for every trace
+    archiver = state.default_archiver
+    revision_keys = state.index[archiver].revision_keys
+    colors = list(range(len(revisions)))
+    history = x_axis == "history"
+    dates = [format_datetime(rev.revision.date) for rev in revisions] if history else []
+    revision_labels = [
+        f"{rev.revision.author_name} <br>{rev.revision.message}" for rev in revisions
+    ]
     for path_ in paths:
         current_path = str(Path(path_))
         x = []
@@ -101,38 +112,22 @@ def graph(
         z = []
         labels = []
         last_y = None
-        for rev in state.index[state.default_archiver].revisions:
+        for i, rev in enumerate(revisions):
             try:
-                val = rev.get(
-                    config, state.default_archiver, operator, current_path, key
-                )
+                val = rev.get(config, archiver, operator, current_path, key)
                 if val != last_y or not changes:
                     y.append(val)
                     if z_axis:
                         z.append(
-                            rev.get(
-                                config,
-                                state.default_archiver,
-                                z_operator,
-                                current_path,
-                                z_key,
-                            )
+                            rev.get(config, archiver, z_operator, current_path, z_key)
                         )
-                    if x_axis == "history":
-                        x.append(format_datetime(rev.revision.date))
+                    if history:
+                        x.append(dates[i])
                     else:
                         x.append(
-                            rev.get(
-                                config,
-                                state.default_archiver,
-                                x_operator,
-                                current_path,
-                                x_key,
-                            )
+                            rev.get(config, archiver, x_operator, current_path, x_key)
                         )
-                    labels.append(
-                        f"{rev.revision.author_name} <br>{rev.revision.message}"
-                    )
+                    labels.append(revision_labels[i])
                 last_y = val
             except KeyError:
                 # missing data
@@ -144,11 +139,11 @@ def graph(
             y=y,
             mode="lines+markers+text" if text else "lines+markers",
             name=f"{path_}",
-            ids=state.index[state.default_archiver].revision_keys,
+            ids=revision_keys,
             text=labels,
             marker={
                 "size": 0 if not z_axis else z,
-                "color": list(range(len(y))),
+                "color": colors[: len(y)],
                 # "colorscale": "Viridis",
             },
             xcalendar="gregorian",
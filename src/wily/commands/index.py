@@ -5,11 +5,9 @@ Print information about the wily cache and what is in the index.
 """
 from typing import List, Tuple
 
-import tabulate
-
 from wily import MAX_MESSAGE_WIDTH, format_date, format_revision, logger
 from wily.config.types import WilyConfig
-from wily.helper import get_maxcolwidth, get_style
+from wily.helper import print_table
 from wily.state import State
 
 
@@ -58,14 +56,4 @@ def index(
         headers = ("Revision", "Author", "Message", "Date")
     else:
         headers = ("Revision", "Author", "Date")
-    maxcolwidth = get_maxcolwidth(headers, wrap)
-    style = get_style()
-    print(
-        tabulate.tabulate(
-            headers=headers,
-            tabular_data=data,
-            tablefmt=style,
-            maxcolwidths=maxcolwidth,
-            maxheadercolwidths=maxcolwidth,
-        )
-    )
+    print_table(headers, data, wrap)
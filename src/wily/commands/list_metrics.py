@@ -3,35 +3,39 @@ List available metrics across all providers.
 
 TODO : Only show metrics for the operators that the cache has?
 """
-import tabulate
+import io
+import sys
 
-from wily.helper import get_maxcolwidth, get_style
+from wily.helper import print_table
 from wily.operators import ALL_OPERATORS
 
+HEADERS = ("Name", "Description", "Type", "Measure", "Aggregate")
+
+""" Table rows for each operator, static for the lifetime of the process """
+OPERATOR_ROWS = tuple(
+    (
+        name,
+        tuple(
+            (
+                m.name,
+                m.description,
+                m.metric_type.__name__,
+                m.measure,
+                m.aggregate.__name__,
+            )
+            for m in operator.operator_cls.metrics
+        ),
+    )
+    for name, operator in ALL_OPERATORS.items()
+)
+
 
 def list_metrics(wrap: bool) -> None:
     """List metrics available."""
-    headers = ("Name", "Description", "Type", "Measure", "Aggregate")
-    maxcolwidth = get_maxcolwidth(headers, wrap)
-    style = get_style()
-    for name, operator in ALL_OPERATORS.items():
-        print(f"{name} operator:")
-        if len(operator.operator_cls.metrics) > 0:
-            print(
-                tabulate.tabulate(
-                    headers=headers,
-                    tabular_data=[
-                        (
-                            m.name,
-                            m.description,
-                            m.metric_type.__name__,
-                            m.measure,
-                            m.aggregate.__name__,
-                        )
-                        for m in operator.operator_cls.metrics
-                    ],
-                    tablefmt=style,
-                    maxcolwidths=maxcolwidth,
-                    maxheadercolwidths=maxcolwidth,
-                )
-            )
+    # Buffer every operator's table and write them to stdout at once
+    output = io.StringIO()
+    for name, rows in OPERATOR_ROWS:
+        output.write(f"{name} operator:\n")
+        if rows:
+            print_table(HEADERS, rows, wrap, file=output)
+    sys.stdout.write(output.getvalue())
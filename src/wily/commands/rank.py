@@ -7,21 +7,76 @@ Will compare the values between files and return a sorted table.
 
 TODO: Layer on Click invocation in operators section, __main__.py file
 """
-import operator as op
-import os
+import heapq
+import logging
 from pathlib import Path
 from sys import exit
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import radon.cli.harvest
-import tabulate
 
 from wily import format_date, format_revision, logger
 from wily.archivers import resolve_archiver
+from wily.cache import get_latest_revision, list_archivers
 from wily.config import DEFAULT_PATH, WilyConfig
-from wily.helper import get_maxcolwidth, get_style
-from wily.operators import resolve_metric_as_tuple
-from wily.state import State
+from wily.helper import iter_relative_paths, print_table
+from wily.operators import Metric, Operator, resolve_metric_as_tuple
+from wily.state import IndexedRevision, State
+
+
+def load_revision_data(
+    config: WilyConfig, operator: Operator, metric: Metric, revision_index: str
+) -> Dict[str, Any]:
+    """
+    Load the value of a metric for every indexed path in the target revision.
+
+    The wily state and the cached revision data are only referenced within this
+    call, so they can be released before the results are ranked and printed.
+    The latest revision is read from the cache sidecar without loading the index.
+
+    :param config: The configuration.
+    :param operator: The operator of the metric.
+    :param metric: The metric to load.
+    :param revision_index: Version of git repository to revert to.
+
+    :return: A dictionary of path to metric value.
+    """
+    if not revision_index:
+        # The latest revision is read from its sidecar, without loading the index
+        archiver = list_archivers(config)[0]
+        latest = get_latest_revision(config, archiver)
+        if latest is None:
+            logger.error(
+                "No revisions in the cache, make sure you have run wily build."
+            )
+            exit(1)
+        target_revision = IndexedRevision.fromdict(latest)
+    else:
+        state = State(config)
+        archiver = state.default_archiver
+        rev = resolve_archiver(archiver).archiver_cls(config).find(revision_index)
+        logger.debug("Resolved %s to %s (%s)", revision_index, rev.key, rev.message)
+        try:
+            target_revision = state.index[archiver][rev.key]
+        except KeyError:
+            logger.error(
+                "Revision %s is not in the cache, make sure you have run wily build.",
+                revision_index,
+            )
+            exit(1)
+
+    logger.info(
+        "-----------Rank for %s for %s by %s on %s.------------",
+        metric.description,
+        format_revision(target_revision.revision.key),
+        target_revision.revision.author_name,
+        format_date(target_revision.revision.date),
+    )
+
+    # Collect every indexed path and its value in a single pass over the revision
+    return target_revision.get_metric_values(
+        config, archiver, operator.name, metric.name
+    )
 
 
 def rank(
@@ -50,42 +105,20 @@ def rank(
     """
     logger.debug("Running rank command")
 
-    data = []
-
-    _operator, resolved_metric = resolve_metric_as_tuple(metric)
-    operator = _operator.name
-
-    state = State(config)
-
-    if not revision_index:
-        target_revision = state.index[state.default_archiver].last_revision
-    else:
-        rev = (
-            resolve_archiver(state.default_archiver)
-            .archiver_cls(config)
-            .find(revision_index)
-        )
-        logger.debug("Resolved %s to %s (%s)", revision_index, rev.key, rev.message)
-        try:
-            target_revision = state.index[state.default_archiver][rev.key]
-        except KeyError:
-            logger.error(
-                "Revision %s is not in the cache, make sure you have run wily build.",
-                revision_index,
-            )
-            exit(1)
+    operator, resolved_metric = resolve_metric_as_tuple(metric)
 
-    logger.info(
-        "-----------Rank for %s for %s by %s on %s.------------",
-        resolved_metric.description,
-        format_revision(target_revision.revision.key),
-        target_revision.revision.author_name,
-        format_date(target_revision.revision.date),
+    revision_data = load_revision_data(
+        config, operator, resolved_metric, revision_index
     )
 
+    # Ranked files and their values, held as parallel columns
+    files_col: List[str] = []
+    values_col: List[Any] = []
+
     if path is None:
-        files = target_revision.get_paths(config, state.default_archiver, operator)
-        logger.debug("Analysing %s", files)
+        files_col = list(revision_data.keys())
+        values_col = list(revision_data.values())
+        logger.debug("Analysing %s", files_col)
     else:
         # Resolve target paths when the cli has specified --path
         if config.path != DEFAULT_PATH:
@@ -93,55 +126,40 @@ def rank(
         else:
             targets = [path]
 
-        # Expand directories to paths
-        files = [
-            os.path.relpath(fn, config.path)
-            for fn in radon.cli.harvest.iter_filenames(targets)
-        ]
-        logger.debug("Targeting - %s", files)
-
-    for item in files:
-        for archiver in state.archivers:
-            try:
-                logger.debug(
-                    "Fetching metric %s for %s in %s",
-                    resolved_metric.name,
-                    operator,
-                    str(item),
-                )
-                val = target_revision.get(
-                    config, archiver, operator, str(item), resolved_metric.name
-                )
-                value = val
-                data.append((item, value))
-            except KeyError:
-                logger.debug("Could not find file %s in index", item)
+        logger.debug("Targeting - %s", targets)
 
-    # Sort by ideal value
-    data = sorted(data, key=op.itemgetter(1), reverse=descending)
+        # Expand directories to paths, matching them against the index as they are found
+        files = radon.cli.harvest.iter_filenames(targets)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for item in iter_relative_paths(files, config.path):
+            if item in revision_data:
+                files_col.append(item)
+                values_col.append(revision_data[item])
+            elif debug:
+                logger.debug("Could not find file %s in index", item)
 
-    if limit:
-        data = data[:limit]
+    # Sort row positions by ideal value, only selecting the top entries when limited
+    rows = range(len(values_col))
+    if limit and 0 < limit < len(values_col):
+        select = heapq.nlargest if descending else heapq.nsmallest
+        order = select(limit, rows, key=values_col.__getitem__)
+    else:
+        order = sorted(rows, key=values_col.__getitem__, reverse=descending)
+        if limit:
+            order = order[:limit]
 
-    if not data:
+    if not order:
         return
 
+    values = [values_col[i] for i in order]
+    data = [(files_col[i], value) for i, value in zip(order, values)]
+
     # Tack on the total row at the end
-    total = resolved_metric.aggregate(rev[1] for rev in data)
+    total = resolved_metric.aggregate(values)
     data.append(("Total", total))
 
     headers = ("File", resolved_metric.description)
-    maxcolwidth = get_maxcolwidth(headers, wrap)
-    style = get_style()
-    print(
-        tabulate.tabulate(
-            headers=headers,
-            tabular_data=data,
-            tablefmt=style,
-            maxcolwidths=maxcolwidth,
-            maxheadercolwidths=maxcolwidth,
-        )
-    )
+    print_table(headers, data, wrap)
 
     if threshold and total < threshold:
         logger.error(
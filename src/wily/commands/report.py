@@ -4,16 +4,15 @@ Report command.
 The report command gives a table of metrics for a specified list of files.
 Will compare the values between revisions and highlight changes in green/red.
 """
+import re
+from functools import lru_cache
 from pathlib import Path
 from shutil import copytree
-from string import Template
-from typing import Dict, Iterable, List, Tuple
-
-import tabulate
+from typing import Any, Callable, Dict, Iterable, List, Match, NamedTuple, Tuple
 
 from wily import MAX_MESSAGE_WIDTH, format_date, format_revision, logger
 from wily.config.types import WilyConfig
-from wily.helper import get_maxcolwidth
+from wily.helper import print_table
 from wily.helper.custom_enums import ReportFormat
 from wily.lang import _
 from wily.operators import MetricType, resolve_metric_as_tuple
@@ -23,6 +22,135 @@ ANSI_RED = 31
 ANSI_GREEN = 32
 ANSI_YELLOW = 33
 
+"""Delta colors (increase, decrease) for each metric measure"""
+MEASURE_COLORS = {
+    MetricType.AimHigh: (ANSI_GREEN, ANSI_RED),
+    MetricType.AimLow: (ANSI_RED, ANSI_GREEN),
+    MetricType.Informational: (ANSI_YELLOW, ANSI_YELLOW),
+}
+
+"""Directory of the HTML report template and its stylesheets"""
+TEMPLATES_DIR = (Path(__file__).parents[1] / "templates").resolve()
+
+"""Map of the ANSI color codes used in deltas to their HTML markup"""
+ANSI_TO_HTML = {
+    f"\u001b[{ANSI_GREEN}m": "<span class='green-color'>",
+    f"\u001b[{ANSI_RED}m": "<span class='red-color'>",
+    f"\u001b[{ANSI_YELLOW}m": "<span class='orange-color'>",
+    "\u001b[0m": "</span>",
+}
+
+"""Pattern matching any of the ANSI color codes used in deltas"""
+ANSI_RE = re.compile("|".join(re.escape(ansi) for ansi in ANSI_TO_HTML))
+
+
+def _ansi_to_html(match: Match) -> str:
+    """Replace a matched ANSI color code with its HTML markup."""
+    return ANSI_TO_HTML[match.group(0)]
+
+
+class MetricMeta(NamedTuple):
+    """Lookup and display details of a metric in a report."""
+
+    key: str
+    operator: str
+    title: str
+    numeric: bool
+    format_cell: Callable[[Any, Any], str]
+
+
+@lru_cache(maxsize=4096, typed=True)
+def format_number(value: Any) -> str:
+    """
+    Format a number with the locale's grouping.
+
+    Metric values and deltas repeat heavily across a report, so the locale
+    aware formatting is cached.
+
+    :param value: The number to format
+    :return: The formatted number
+    """
+    return format(value, "n")
+
+
+def make_cell_formatter(
+    metric_type: Any, increase_color: int, decrease_color: int
+) -> Callable[[Any, Any], str]:
+    """
+    Make a function that formats a report cell for a metric.
+
+    :param metric_type: The type of the metric values
+    :param increase_color: ANSI color for increased values
+    :param decrease_color: ANSI color for decreased values
+    :return: A function of the value and its delta, returning the cell text
+    """
+    if metric_type not in (int, float):
+
+        def format_text(val: Any, delta: Any) -> str:
+            return f"{val}"
+
+        return format_text
+
+    increase = f" (\u001b[{increase_color}m+"
+    decrease = f" (\u001b[{decrease_color}m"
+
+    def format_numeric(val: Any, delta: Any) -> str:
+        if delta == 0:
+            # Unchanged values are the common case, skip the delta styling
+            return f"{format_number(val)} ({delta})"
+        elif delta < 0:
+            return f"{format_number(val)}{decrease}{format_number(delta)}\u001b[0m)"
+        return f"{format_number(val)}{increase}{format_number(delta)}\u001b[0m)"
+
+    return format_numeric
+
+
+@lru_cache(maxsize=1)
+def get_report_template() -> Tuple[str, str, str]:
+    """
+    Get the template of the HTML report, read once per process.
+
+    The template is split around its headers and content placeholders so the
+    report can be streamed into it.
+
+    :return: The template before the headers, between the headers and the
+        content, and after the content
+    """
+    template = (TEMPLATES_DIR / "report_template.html").read_text()
+    head, _sep, rest = template.partition("$headers")
+    middle, _sep, tail = rest.partition("$content")
+    return head, middle, tail
+
+
+@lru_cache(maxsize=128)
+def get_metric_metas(metrics: Tuple[str, ...]) -> Tuple[MetricMeta, ...]:
+    """
+    Get the lookup and display details of each metric in a report.
+
+    :param metrics: The sorted metric names
+    :return: A tuple of metric details, in the same order as the names
+    """
+    metric_metas = []
+    for metric_name in metrics:
+        operator, metric = resolve_metric_as_tuple(metric_name)
+        key = metric.name
+        # Set the delta colors depending on the metric type
+        increase_color, decrease_color = MEASURE_COLORS.get(
+            metric.measure, (ANSI_YELLOW, ANSI_YELLOW)
+        )
+        metric_metas.append(
+            MetricMeta(
+                key=key,
+                operator=operator.name,
+                title=metric.description,
+                numeric=metric.metric_type in (int, float),
+                format_cell=make_cell_formatter(
+                    metric.metric_type, increase_color, decrease_color
+                ),
+            )
+        )
+    return tuple(metric_metas)
+
 
 def report(
     config: WilyConfig,
@@ -55,108 +183,87 @@ def report(
     logger.info("-----------History for %s------------", metrics)
 
     data: List[Tuple[str, ...]] = []
-    metric_metas = []
-
-    for metric_name in metrics:
-        operator, metric = resolve_metric_as_tuple(metric_name)
-        key = metric.name
-        # Set the delta colors depending on the metric type
-        if metric.measure == MetricType.AimHigh:
-            increase_color = ANSI_GREEN
-            decrease_color = ANSI_RED
-        elif metric.measure == MetricType.AimLow:
-            increase_color = ANSI_RED
-            decrease_color = ANSI_GREEN
-        elif metric.measure == MetricType.Informational:
-            increase_color = ANSI_YELLOW
-            decrease_color = ANSI_YELLOW
-        else:
-            increase_color = ANSI_YELLOW
-            decrease_color = ANSI_YELLOW
-        metric_meta = {
-            "key": key,
-            "operator": operator.name,
-            "increase_color": increase_color,
-            "decrease_color": decrease_color,
-            "title": metric.description,
-            "type": metric.metric_type,
-        }
-        metric_metas.append(metric_meta)
+    metric_metas = get_metric_metas(tuple(metrics))
 
     state = State(config)
     for archiver in state.archivers:
-        history = state.index[archiver].revisions[:n][::-1]
+        history = reversed(state.index[archiver].revisions[:n])
         last: Dict = {}
         for rev in history:
             deltas = []
-            vals = []
+            values: List[Any] = []
+            # Fetch the metrics of the path once per operator, not once per metric
+            path_metrics: Dict[str, Dict] = {}
             for meta in metric_metas:
                 try:
                     logger.debug(
                         "Fetching metric %s for %s in %s",
-                        meta["key"],
-                        meta["operator"],
+                        meta.key,
+                        meta.operator,
                         path,
                     )
-                    val = rev.get(config, archiver, meta["operator"], path, meta["key"])
+                    if meta.operator not in path_metrics:
+                        path_metrics[meta.operator] = rev.get_path_metrics(
+                            config, archiver, meta.operator, path
+                        )
+                    val = path_metrics[meta.operator][meta.key]
 
-                    last_val = last.get(meta["key"], None)
+                    last_val = last.get(meta.key, None)
                     # Measure the difference between this value and the last
-                    if meta["type"] in (int, float):
+                    if meta.numeric:
                         if last_val:
                             delta = val - last_val
                         else:
                             delta = 0
-                        last[meta["key"]] = val
+                        last[meta.key] = val
                     else:
                         # TODO : Measure ranking increases/decreases for str types?
                         delta = 0
-
-                    if delta == 0:
-                        delta_col = delta
-                    elif delta < 0:
-                        delta_col = (
-                            f"\u001b[{meta['decrease_color']}m{delta:n}\u001b[0m"
-                        )
-                    else:
-                        delta_col = (
-                            f"\u001b[{meta['increase_color']}m+{delta:n}\u001b[0m"
-                        )
-
-                    if meta["type"] in (int, float):
-                        k = f"{val:n} ({delta_col})"
-                    else:
-                        k = f"{val}"
                 except KeyError as e:
-                    k = f"Not found {e}"
+                    val = e
                     delta = 0
                 deltas.append(delta)
-                vals.append(k)
-            if not changes_only or any(deltas):
-                if include_message:
-                    data.append(
-                        (
-                            format_revision(rev.revision.key),
-                            rev.revision.message[:MAX_MESSAGE_WIDTH],
-                            str(rev.revision.author_name),
-                            format_date(rev.revision.date),
-                            *vals,
-                        )
-                    )
+                values.append(val)
+
+            # Only format the cells of revisions that will be shown
+            if changes_only and not any(deltas):
+                continue
+
+            vals = []
+            for meta, val, delta in zip(metric_metas, values, deltas):
+                if isinstance(val, KeyError):
+                    vals.append(f"Not found {val}")
                 else:
-                    data.append(
-                        (
-                            format_revision(rev.revision.key),
-                            str(rev.revision.author_name),
-                            format_date(rev.revision.date),
-                            *vals,
-                        )
+                    vals.append(meta.format_cell(val, delta))
+
+            revision = rev.revision
+            if include_message:
+                data.append(
+                    (
+                        format_revision(revision.key),
+                        revision.message[:MAX_MESSAGE_WIDTH],
+                        str(revision.author_name),
+                        format_date(revision.date),
+                        *vals,
+                    )
+                )
+            else:
+                data.append(
+                    (
+                        format_revision(revision.key),
+                        str(revision.author_name),
+                        format_date(revision.date),
+                        *vals,
                     )
+                )
     if not data:
         logger.error("No data found for %s with changes=%s.", path, changes_only)
         return
 
-    descriptions = [meta["title"] for meta in metric_metas]
+    # Show the newest revision first, reversing in place rather than copying
+    data.reverse()
+
+    descriptions = [meta.title for meta in metric_metas]
     if include_message:
         headers = (_("Revision"), _("Message"), _("Author"), _("Date"), *descriptions)
     else:
@@ -172,42 +279,26 @@ def report(
 
         report_path.mkdir(exist_ok=True, parents=True)
 
-        templates_dir = (Path(__file__).parents[1] / "templates").resolve()
-        report_template = Template((templates_dir / "report_template.html").read_text())
-
-        table_headers = "".join([f"<th>{header}</th>" for header in headers])
-        table_content = ""
-        for line in data[::-1]:
-            table_content += "<tr>"
-            for element in line:
-                element = element.replace("\u001b[32m", "<span class='green-color'>")
-                element = element.replace("\u001b[31m", "<span class='red-color'>")
-                element = element.replace("\u001b[33m", "<span class='orange-color'>")
-                element = element.replace("\u001b[0m", "</span>")
-                table_content += f"<td>{element}</td>"
-            table_content += "</tr>"
-
-        rendered_report = report_template.safe_substitute(
-            headers=table_headers, content=table_content
-        )
+        head, middle, tail = get_report_template()
 
         with report_output.open("w", errors="xmlcharrefreplace") as output_f:
-            output_f.write(rendered_report)
+            output_f.write(head)
+            output_f.write("".join([f"<th>{header}</th>" for header in headers]))
+            output_f.write(middle)
+            # Write each row as it is rendered rather than building the whole table
+            for line in data:
+                cells = []
+                for element in line:
+                    # Only delta cells carry color codes, skip the others
+                    if "\u001b" in element:
+                        element = ANSI_RE.sub(_ansi_to_html, element)
+                    cells.append(f"<td>{element}</td>")
+                output_f.write(f"<tr>{''.join(cells)}</tr>")
+            output_f.write(tail)
 
-        try:
-            copytree(str(templates_dir / "css"), str(report_path / "css"))
-        except FileExistsError:
-            pass
+        if not (report_path / "css").exists():
+            copytree(str(TEMPLATES_DIR / "css"), str(report_path / "css"))
 
         logger.info("wily report was saved to %s", report_path)
     else:
-        maxcolwidth = get_maxcolwidth(headers, wrap)
-        print(
-            tabulate.tabulate(
-                headers=headers,
-                tabular_data=data[::-1],
-                tablefmt=console_format,
-                maxcolwidths=maxcolwidth,
-                maxheadercolwidths=maxcolwidth,
-            )
-        )
+        print_table(headers, data, wrap, console_format)
@@ -41,7 +41,7 @@ class WilyConfig:
     def cache_path(self):
         """Path to the cache."""
         if not self._cache_path:  # type: ignore
-            self._cache_path = generate_cache_path(pathlib.Path(self.path).absolute())  # type: ignore
+            self._cache_path = generate_cache_path(str(pathlib.Path(self.path).absolute()))  # type: ignore
         return self._cache_path  # type: ignore
 
     @cache_path.setter
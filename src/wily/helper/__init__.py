@@ -1,11 +1,12 @@
 """Helper package for wily."""
 import hashlib
 import logging
+import os.path
 import pathlib
 import shutil
 import sys
 from functools import lru_cache
-from typing import Optional, Sized, Union
+from typing import Any, Iterable, Iterator, Optional, Sequence, Sized, TextIO, Union
 
 from wily.defaults import DEFAULT_GRID_STYLE
 
@@ -30,15 +31,71 @@ def get_maxcolwidth(headers: Sized, wrap=True) -> Optional[int]:
 
 def get_style(style: str = DEFAULT_GRID_STYLE) -> str:
     """Select the tablefmt style for tabulate according to what sys.stdout can handle."""
+    return _get_style_for_encoding(style, sys.stdout.encoding)
+
+
+@lru_cache(maxsize=32)
+def _get_style_for_encoding(style: str, encoding: Optional[str]) -> str:
+    """Select the tablefmt style for tabulate for a given output encoding."""
     if style == DEFAULT_GRID_STYLE:
-        encoding = sys.stdout.encoding
         # StringIO has encoding=None, but it handles utf-8 fine.
         if encoding is not None and encoding.lower() not in ("utf-8", "utf8"):
             style = "grid"
     return style
 
 
-@lru_cache(maxsize=128)
+def print_table(
+    headers: Sequence[str],
+    data: Iterable[Sequence[Any]],
+    wrap: bool,
+    style: str = DEFAULT_GRID_STYLE,
+    file: Optional[TextIO] = None,
+) -> None:
+    """
+    Print a table of data, fitted to the terminal when wrapping.
+
+    The rendered table is written with a single call to ``write``.
+
+    :param headers: The column headers.
+    :param data: The rows of the table.
+    :param wrap: Wrap the columns to fit the terminal width.
+    :param style: The tabulate tablefmt style.
+    :param file: The stream to write to, defaults to stdout.
+    """
+    import tabulate
+
+    maxcolwidth = get_maxcolwidth(headers, wrap)
+    table = tabulate.tabulate(
+        headers=headers,
+        tabular_data=data,
+        tablefmt=get_style(style),
+        maxcolwidths=maxcolwidth,
+        maxheadercolwidths=maxcolwidth,
+    )
+    (file or sys.stdout).write(table + "\n")
+
+
+def iter_relative_paths(filenames: Iterable[str], root: str) -> Iterator[str]:
+    """
+    Yield each filename relative to a root directory.
+
+    Paths beneath the root are sliced off its absolute prefix, only paths
+    outside of it fall back to ``os.path.relpath``.
+
+    :param filenames: The paths to convert.
+    :param root: The directory to make the paths relative to.
+    """
+    root = os.path.abspath(root)
+    prefix = os.path.join(root, "")
+    for filename in filenames:
+        path = os.path.abspath(filename)
+        if path.startswith(prefix):
+            yield path[len(prefix) :]
+        else:
+            yield os.path.relpath(path, root)
+
+
+@lru_cache(maxsize=None)
 def generate_cache_path(path: Union[pathlib.Path, str]) -> str:
     """
     Generate a reusable path to cache results.
@@ -50,7 +107,7 @@ def generate_cache_path(path: Union[pathlib.Path, str]) -> str:
     """
     logger.debug("Generating cache for %s", path)
     sha = hashlib.sha1(str(path).encode()).hexdigest()[:9]
-    HOME = pathlib.Path.home()
-    cache_path = str(HOME / ".wily" / sha)
+    # Plain string joins, the home directory is still read per call to follow $HOME
+    cache_path = os.path.join(os.path.expanduser("~"), ".wily", sha)
     logger.debug("Cache path is %s", cache_path)
     return cache_path
@@ -5,5 +5,4 @@ import os
 
 localedir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "locales")
 trans = gettext.translation("messages", localedir=localedir, fallback=True)
-trans.install()
 _ = trans.gettext
@@ -1,5 +1,8 @@
 """Models and types for "operators" the basic measure of a module that measures code."""
 
+import math
+import statistics
+import sys
 from enum import Enum
 from functools import lru_cache
 from typing import (
@@ -10,7 +13,6 @@ from typing import (
     Iterable,
     List,
     Optional,
-    Set,
     Tuple,
     Type,
     TypeVar,
@@ -32,6 +34,23 @@ class MetricType(Enum):
 TValue = TypeVar("TValue", str, int, float)
 
 
+if sys.version_info >= (3, 8):
+
+    def mean(values: Iterable[float]) -> float:
+        """Calculate the floating point mean of some values."""
+        # C-accelerated, unlike the exact fraction arithmetic of statistics.mean
+        return statistics.fmean(values)
+
+else:
+
+    def mean(values: Iterable[float]) -> float:
+        """Calculate the floating point mean of some values."""
+        values = list(values)
+        if not values:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return math.fsum(values) / len(values)
+
+
 class Metric(Generic[TValue]):
     """Represents a metric."""
 
@@ -187,15 +206,20 @@ ALL_OPERATORS: Dict[str, Operator] = {
 }
 
 
-"""Set of all metrics"""
-ALL_METRICS: Set[Tuple[Operator, Metric[Any]]] = {
+"""Tuple of all metrics, in operator order"""
+ALL_METRICS: Tuple[Tuple[Operator, Metric[Any]], ...] = tuple(
     (operator, metric)
-    for operator in ALL_OPERATORS.values()
+    for operator in _OPERATORS
     for metric in operator.operator_cls.metrics
+)
+
+"""Dictionary of all metrics by metric name"""
+ALL_METRICS_BY_NAME: Dict[str, Tuple[Operator, Metric[Any]]] = {
+    metric.name: (operator, metric) for operator, metric in ALL_METRICS
 }
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def resolve_operator(name: str) -> Operator:
     """
     Get the :namedtuple:`wily.operators.Operator` for a given name.
@@ -214,23 +238,41 @@ def resolve_operators(operators: Iterable[Union[Operator, str]]) -> List[Operato
     return [resolve_operator(operator) for operator in iter(operators)]
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def resolve_metric(metric: str) -> Metric:
     """Resolve metric key to a given target."""
     return resolve_metric_as_tuple(metric)[1]
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def resolve_metric_as_tuple(metric: str) -> Tuple[Operator, Metric]:
     """Resolve metric key to a given target."""
-    if "." in metric:
-        _, metric = metric.split(".")
+    # Drop the operator prefix, e.g. "raw.loc" -> "loc"
+    _operator, sep, name = metric.partition(".")
+    if sep:
+        metric = name
 
-    r = [(operator, match) for operator, match in ALL_METRICS if match.name == metric]
-    if not r or len(r) == 0:
+    if metric not in ALL_METRICS_BY_NAME:
         raise ValueError(f"Metric {metric} not recognised.")
     else:
-        return r[0]
+        return ALL_METRICS_BY_NAME[metric]
+
+
+def get_path_metrics(
+    revision: Dict[Any, Any], operator: str, path: str
+) -> Dict[str, Any]:
+    """
+    Get all the metrics of a path from the cache.
+
+    :param revision: The revision data.
+    :param operator: The operator name.
+    :param path: The path to the file/function
+    :return: Dictionary of metric key to value
+    """
+    part, sep, entry = path.partition(":")
+    if sep:
+        return revision[operator][part]["detailed"][entry]
+    return revision[operator][path]["total"]
 
 
 def get_metric(revision: Dict[Any, Any], operator: str, path: str, key: str) -> Any:
@@ -243,9 +285,4 @@ def get_metric(revision: Dict[Any, Any], operator: str, path: str, key: str) ->
     :param key: The key of the data
     :return: Data from the cache
     """
-    if ":" in path:
-        part, entry = path.split(":")
-        val = revision[operator][part]["detailed"][entry][key]
-    else:
-        val = revision[operator][path]["total"][key]
-    return val
+    return get_path_metrics(revision, operator, path)[key]
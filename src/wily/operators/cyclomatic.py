@@ -3,7 +3,6 @@ Cyclomatic complexity metric for each function/method.
 
 Provided by the radon library.
 """
-import statistics
 from typing import Any, Dict, Iterable
 
 import radon.cli.harvest as harvesters
@@ -14,7 +13,7 @@ from radon.visitors import Class, Function
 from wily import logger
 from wily.config.types import WilyConfig
 from wily.lang import _
-from wily.operators import BaseOperator, Metric, MetricType
+from wily.operators import BaseOperator, Metric, MetricType, mean
 
 
 class CyclomaticComplexityOperator(BaseOperator):
@@ -39,7 +38,7 @@ class CyclomaticComplexityOperator(BaseOperator):
             _("Cyclomatic Complexity"),
             float,
             MetricType.AimLow,
-            statistics.mean,
+            mean,
         ),
     )
 
@@ -67,8 +66,8 @@ class CyclomaticComplexityOperator(BaseOperator):
         """
         logger.debug("Running CC harvester")
         results: Dict[str, Dict[str, Any]] = {}
-        for filename, details in dict(self.harvester.results).items():
-            results[filename] = {"detailed": {}, "total": {}}
+        for filename, details in self.harvester.results:
+            detailed: Dict[str, Dict[str, Any]] = {}
             total = 0  # running CC total
             for instance in details:
                 if isinstance(instance, Class):
@@ -90,10 +89,9 @@ class CyclomaticComplexityOperator(BaseOperator):
                             type(instance),
                         )
                         continue
-                results[filename]["detailed"][i["fullname"]] = i
-                del i["fullname"]
+                detailed[instance.fullname] = i
                 total += i["complexity"]
-            results[filename]["total"]["complexity"] = total
+            results[filename] = {"detailed": detailed, "total": {"complexity": total}}
         return results
 
     @staticmethod
@@ -104,7 +102,6 @@ class CyclomaticComplexityOperator(BaseOperator):
             "classname": l.classname,
             "closures": l.closures,
             "complexity": l.complexity,
-            "fullname": l.fullname,
             "loc": l.endline - l.lineno,
             "lineno": l.lineno,
             "endline": l.endline,
@@ -117,7 +114,6 @@ class CyclomaticComplexityOperator(BaseOperator):
             "inner_classes": l.inner_classes,
             "real_complexity": l.real_complexity,
             "complexity": l.complexity,
-            "fullname": l.fullname,
             "loc": l.endline - l.lineno,
             "lineno": l.lineno,
             "endline": l.endline,
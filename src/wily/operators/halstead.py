@@ -134,7 +134,7 @@ class HalsteadOperator(BaseOperator):
         """
         logger.debug("Running halstead harvester")
         results: Dict[str, Dict[str, Any]] = {}
-        for filename, details in dict(self.harvester.results).items():
+        for filename, details in self.harvester.results:
             results[filename] = {"detailed": {}, "total": {}}
             for instance in details:
                 if isinstance(instance, list):
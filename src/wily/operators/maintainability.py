@@ -3,7 +3,6 @@ Maintainability operator.
 
 Measures the "maintainability" using the Halstead index.
 """
-import statistics
 from collections import Counter
 from typing import Any, Dict, Iterable
 
@@ -13,7 +12,7 @@ from radon.cli import Config
 from wily import logger
 from wily.config.types import WilyConfig
 from wily.lang import _
-from wily.operators import BaseOperator, Metric, MetricType
+from wily.operators import BaseOperator, Metric, MetricType, mean
 
 
 def mode(data):
@@ -47,9 +46,7 @@ class MaintainabilityIndexOperator(BaseOperator):
         Metric(
             "rank", _("Maintainability Ranking"), str, MetricType.Informational, mode
         ),
-        Metric(
-            "mi", _("Maintainability Index"), float, MetricType.AimHigh, statistics.mean
-        ),
+        Metric("mi", _("Maintainability Index"), float, MetricType.AimHigh, mean),
     )
 
     default_metric_index = 1  # MI
@@ -76,6 +73,6 @@ class MaintainabilityIndexOperator(BaseOperator):
         """
         logger.debug("Running maintainability harvester")
         results = {}
-        for filename, metrics in dict(self.harvester.results).items():
+        for filename, metrics in self.harvester.results:
             results[filename] = {"total": metrics}
         return results
@@ -65,6 +65,6 @@ class RawMetricsOperator(BaseOperator):
         """
         logger.debug("Running raw harvester")
         results = {}
-        for filename, metrics in dict(self.harvester.results).items():
+        for filename, metrics in self.harvester.results:
             results[filename] = {"total": metrics}
         return results
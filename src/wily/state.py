@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional, Union
 from wily import cache, logger
 from wily.archivers import Archiver, BaseArchiver, Revision, resolve_archiver
 from wily.config.types import WilyConfig
-from wily.operators import Operator, get_metric
+from wily.operators import Operator, get_metric, get_path_metrics
 
 
 @dataclass
@@ -65,6 +65,26 @@ class IndexedRevision:
         logger.debug("Fetching metric %s - %s for operator %s", path, key, operator)
         return get_metric(self._data, operator, path, key)
 
+    def get_path_metrics(
+        self, config: WilyConfig, archiver: str, operator: str, path: str
+    ) -> Dict[str, Any]:
+        """
+        Get all the metric data of a path for this indexed revision.
+
+        :param config: The wily config.
+        :param archiver: The archiver.
+        :param operator: The operator to find
+        :param path: The path to find
+
+        :return: A dictionary of metric key to value
+        """
+        if not self._data:
+            self._data = cache.get(
+                config=config, archiver=archiver, revision=self.revision.key
+            )["operator_data"]
+        logger.debug("Fetching metrics %s for operator %s", path, operator)
+        return get_path_metrics(self._data, operator, path)
+
     def get_paths(self, config: WilyConfig, archiver: str, operator: str) -> List[str]:
         """
         Get the indexed paths for this indexed revision.
@@ -82,6 +102,32 @@ class IndexedRevision:
         logger.debug("Fetching keys")
         return list(self._data[operator].keys())
 
+    def get_metric_values(
+        self, config: WilyConfig, archiver: str, operator: str, key: str
+    ) -> Dict[str, Any]:
+        """
+        Get the total value of a metric for every indexed path in this revision.
+
+        Paths without a value for the metric are omitted.
+
+        :param config: The wily config.
+        :param archiver: The archiver.
+        :param operator: The operator to find
+        :param key: The metric key
+
+        :return: A dictionary of path to metric value
+        """
+        if not self._data:
+            self._data = cache.get(
+                config=config, archiver=archiver, revision=self.revision.key
+            )["operator_data"]
+        logger.debug("Fetching metric %s for operator %s", key, operator)
+        return {
+            path: entry["total"][key]
+            for path, entry in self._data[operator].items()
+            if key in entry.get("total", {})
+        }
+
     def store(
         self, config: WilyConfig, archiver: Union[Archiver, str], stats: Dict[str, Any]
     ) -> Path:
@@ -36,3 +36,16 @@ def test_index(config):
         assert state.index["git"][revision.revision.key]
         assert revision.revision in state.index["git"]
         assert revision.revision.key in state.index["git"]
+
+
+def test_index_revision_metric_values(config):
+    """Test the bulk metric values of an indexed revision"""
+    state = wily.state.State(config)
+    last_revision = state.index["git"].last_revision
+
+    values = last_revision.get_metric_values(config, "git", "raw", "loc")
+    paths = last_revision.get_paths(config, "git", "raw")
+    assert values
+    assert set(values) <= set(paths)
+    for path, value in values.items():
+        assert value == last_revision.get(config, "git", "raw", path, "loc")
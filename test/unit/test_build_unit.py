@@ -85,3 +85,9 @@ def test_run_operator(config):
     assert name == "mock"
     path = "C:\\home\\test1.py" if sys.platform == "win32" else "/home/test1.py"
     assert data == {os.path.relpath(path, config.path): None}
+
+
+def test_native_paths():
+    paths = ["a.py", "src/b.py", "src/nested/c.py"]
+    expected = [str(os.path.join(*path.split("/"))) for path in paths]
+    assert list(build.native_paths(paths)) == expected
@@ -195,3 +195,37 @@ def test_store_index(tmpdir):
         result = json.load(cache_item)
         assert isinstance(result, list)
         assert result[0] == _TEST_INDEX[1]
+
+
+def test_store_index_latest(tmpdir):
+    """
+    Test that storing the index writes the newest record to the sidecar
+    """
+    config = DEFAULT_CONFIG
+    cache_path = pathlib.Path(tmpdir) / ".wily"
+    cache_path.mkdir()
+    config.cache_path = cache_path
+    config.path = tmpdir
+    _TEST_INDEX = [{"message": "a", "date": 1234}, {"message": "b", "date": 1345}]
+    cache.store_archiver_index(config, ARCHIVER_GIT, _TEST_INDEX)
+    assert (cache_path / "git" / "latest.json").exists()
+    assert cache.get_latest_revision(config, ARCHIVER_GIT) == _TEST_INDEX[1]
+
+
+def test_get_latest_revision_without_sidecar(tmpdir):
+    """
+    Test that the latest revision falls back to the index without a sidecar
+    """
+    config = DEFAULT_CONFIG
+    cache_path = pathlib.Path(tmpdir) / ".wily"
+    (cache_path / "git").mkdir(parents=True)
+    config.cache_path = cache_path
+    with open(cache_path / "git" / "index.json", "w") as f:
+        f.write(json.dumps([{"message": "b", "date": 1345}]))
+    assert cache.get_latest_revision(config, ARCHIVER_GIT) == {
+        "message": "b",
+        "date": 1345,
+    }
+    with open(cache_path / "git" / "index.json", "w") as f:
+        f.write("[]")
+    assert cache.get_latest_revision(config, ARCHIVER_GIT) is None
@@ -8,12 +8,13 @@ from wily.config import DEFAULT_CONFIG
 
 
 class MockCC:
-    results = {}
+    # radon harvesters yield (filename, details) pairs
+    results = []
 
 
 @mock.patch("wily.operators.cyclomatic.harvesters.CCHarvester", return_value=MockCC)
 def test_cyclomatic_bad_entry_data(harvester):
-    MockCC.results = {"test.py": [{"complexity": 5}]}
+    MockCC.results = [("test.py", [{"complexity": 5}])]
     op = wily.operators.cyclomatic.CyclomaticComplexityOperator(DEFAULT_CONFIG, ["."])
     results = op.run("test.py", {})
     assert results == {"test.py": {"detailed": {}, "total": {"complexity": 0}}}
@@ -21,7 +22,7 @@ def test_cyclomatic_bad_entry_data(harvester):
 
 @mock.patch("wily.operators.cyclomatic.harvesters.CCHarvester", return_value=MockCC)
 def test_cyclomatic_error_case(harvester):
-    MockCC.results = {"test.py": {"error": "bad data"}}
+    MockCC.results = [("test.py", {"error": "bad data"})]
     op = wily.operators.cyclomatic.CyclomaticComplexityOperator(DEFAULT_CONFIG, ["."])
     results = op.run("test.py", {})
     assert results == {"test.py": {"detailed": {}, "total": {"complexity": 0}}}
@@ -29,7 +30,7 @@ def test_cyclomatic_error_case(harvester):
 
 @mock.patch("wily.operators.cyclomatic.harvesters.CCHarvester", return_value=MockCC)
 def test_cyclomatic_error_case_unexpected(harvester):
-    MockCC.results = {"test.py": [1234]}
+    MockCC.results = [("test.py", [1234])]
     op = wily.operators.cyclomatic.CyclomaticComplexityOperator(DEFAULT_CONFIG, ["."])
     results = op.run("test.py", {})
     assert results == {"test.py": {"detailed": {}, "total": {"complexity": 0}}}
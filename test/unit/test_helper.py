@@ -1,10 +1,16 @@
+import os
 from io import BytesIO, StringIO, TextIOWrapper
 from unittest import mock
 
 import tabulate
 
 from wily.defaults import DEFAULT_GRID_STYLE
-from wily.helper import get_maxcolwidth, get_style
+from wily.helper import (
+    get_maxcolwidth,
+    get_style,
+    iter_relative_paths,
+    print_table,
+)
 
 SHORT_DATA = [list("abcdefgh"), list("abcdefgh")]
 
@@ -156,3 +162,24 @@ def test_get_style_none():
     with mock.patch("sys.stdout", output):
         style = get_style()
     assert style == "fancy_grid"
+
+
+def test_iter_relative_paths(tmpdir):
+    root = str(tmpdir)
+    filenames = [
+        os.path.join(root, "a.py"),
+        os.path.join(root, "src", "b.py"),
+        os.path.join(root, "src", "..", "c.py"),
+        os.path.join(os.path.dirname(root), "d.py"),
+    ]
+    result = list(iter_relative_paths(filenames, root))
+    assert result == [os.path.relpath(filename, root) for filename in filenames]
+
+
+def test_print_table(capsys):
+    print_table(("a", "b"), SHORT_DATA, False, "grid")
+    captured = capsys.readouterr()
+    expected = tabulate.tabulate(
+        headers=("a", "b"), tabular_data=SHORT_DATA, tablefmt="grid"
+    )
+    assert captured.out == expected + "\n"
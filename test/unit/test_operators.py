@@ -1,3 +1,5 @@
+import statistics
+
 import pytest
 
 import wily.operators
@@ -32,3 +34,66 @@ def test_resolve_invalid_metric():
 def test_resolve_short_metric():
     metric = wily.operators.resolve_metric("loc")
     assert metric.name == "loc"
+
+
+def test_resolve_metric_as_tuple():
+    operator, metric = wily.operators.resolve_metric_as_tuple("halstead.h1")
+    assert operator == wily.operators.OPERATOR_HALSTEAD
+    assert metric.name == "h1"
+
+
+def test_resolve_metric_as_tuple_multiple_dots():
+    with pytest.raises(ValueError, match="Metric b.c not recognised."):
+        wily.operators.resolve_metric_as_tuple("a.b.c")
+    with pytest.raises(ValueError, match="not recognised"):
+        wily.operators.resolve_metric_as_tuple("raw.loc,maintainability.rank")
+
+
+def test_all_metrics_by_name():
+    assert len(wily.operators.ALL_METRICS_BY_NAME) == len(wily.operators.ALL_METRICS)
+    for operator, metric in wily.operators.ALL_METRICS:
+        assert wily.operators.ALL_METRICS_BY_NAME[metric.name] == (operator, metric)
+
+
+def test_get_path_metrics():
+    revision = {
+        "raw": {
+            "file.py": {
+                "total": {"loc": 10, "sloc": 8},
+                "detailed": {"func": {"loc": 3, "sloc": 2}},
+            }
+        }
+    }
+    assert wily.operators.get_path_metrics(revision, "raw", "file.py") == {
+        "loc": 10,
+        "sloc": 8,
+    }
+    assert wily.operators.get_path_metrics(revision, "raw", "file.py:func") == {
+        "loc": 3,
+        "sloc": 2,
+    }
+    assert wily.operators.get_metric(revision, "raw", "file.py:func", "sloc") == 2
+    with pytest.raises(KeyError):
+        wily.operators.get_path_metrics(revision, "raw", "other.py")
+
+
+def test_all_metrics_order():
+    operators = [operator for operator, _ in wily.operators.ALL_METRICS]
+    assert operators == sorted(operators, key=wily.operators._OPERATORS.index)
+    assert len(wily.operators.ALL_METRICS) == len(set(wily.operators.ALL_METRICS))
+
+
+def test_mean():
+    assert wily.operators.mean([1, 2, 4]) == pytest.approx(7 / 3)
+    assert wily.operators.mean(iter([2.5])) == 2.5
+    with pytest.raises(statistics.StatisticsError):
+        wily.operators.mean([])
+
+
+def test_mean_aggregate_is_float():
+    """Directory aggregates of integer metrics are cached as floats."""
+    complexity = wily.operators.OPERATOR_CYCLOMATIC.operator_cls.metrics[0]
+    total = complexity.aggregate([4, 5])
+    assert total == 4.5
+    assert isinstance(total, float)
+    assert isinstance(wily.operators.mean([2, 2]), float)
@@ -7,7 +7,14 @@ from unittest import mock
 from util import get_mock_state_and_config
 
 from wily import format_date as fd
-from wily.commands.report import report
+from wily.commands.report import (
+    ANSI_GREEN,
+    ANSI_RED,
+    format_number,
+    get_metric_metas,
+    make_cell_formatter,
+    report,
+)
 from wily.defaults import DEFAULT_GRID_STYLE
 from wily.helper.custom_enums import ReportFormat
 
@@ -412,3 +419,31 @@ def get_outputs():
         is_file=True, suffix=".html", parents=[mock.MagicMock()], open=opener
     )
     return mock_output, output
+
+
+def test_get_metric_metas():
+    metas = get_metric_metas(("cyclomatic.complexity", "raw.loc"))
+    assert [meta.key for meta in metas] == ["complexity", "loc"]
+    assert [meta.operator for meta in metas] == ["cyclomatic", "raw"]
+    # Complexity should go down, so increases are red and decreases green
+    assert metas[0].format_cell(3, 1) == "3 (\u001b[31m+1\u001b[0m)"
+    assert metas[0].format_cell(3, -1) == "3 (\u001b[32m-1\u001b[0m)"
+    assert metas[0].format_cell(3, 0) == "3 (0)"
+    assert get_metric_metas(("cyclomatic.complexity", "raw.loc")) is metas
+
+
+def test_make_cell_formatter():
+    format_numeric = make_cell_formatter(int, ANSI_GREEN, ANSI_RED)
+    assert format_numeric(3, 0) == "3 (0)"
+    assert format_numeric(3, 1) == "3 (\u001b[32m+1\u001b[0m)"
+    assert format_numeric(3, -1) == "3 (\u001b[31m-1\u001b[0m)"
+    # Unchanged float values keep the float delta, as before
+    assert format_numeric(100.0, 0.0) == "100 (0.0)"
+    format_text = make_cell_formatter(str, ANSI_GREEN, ANSI_RED)
+    assert format_text("A", 0) == "A"
+
+
+def test_format_number():
+    assert format_number(1) == f"{1:n}"
+    assert format_number(1.5) == f"{1.5:n}"
+    assert format_number(-2) == f"{-2:n}"
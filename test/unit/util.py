@@ -68,6 +68,16 @@ def add_revision(
     else:
         mock_get = mock.Mock(return_value=val or rev)
     mock_revision = mock.Mock(get=mock_get, **rev_dict)
+    mock_path_metrics = mock.MagicMock()
+    mock_path_metrics.__getitem__ = mock_get
+    mock_revision.get_path_metrics = mock.Mock(return_value=mock_path_metrics)
     mock_get_paths = mock.MagicMock(return_value=("file1", "file2"))
     mock_revision.get_paths = mock_get_paths
+    if with_keyerror:
+        metric_values = {}
+    elif ascending:
+        metric_values = {"file1": 0, "file2": 1}
+    else:
+        metric_values = {"file1": val or rev, "file2": val or rev}
+    mock_revision.get_metric_values = mock.MagicMock(return_value=metric_values)
     revisions.append(mock_revision)